@@ -10,17 +10,40 @@ This is the polished UI version with:
 """
 
 import streamlit as st
-from pipeline.transcribe import transcribe_audio
+from pipeline.transcribe import transcribe_audio, TranscriptionCancelled
 from pipeline.summarize import summarize_transcript
 from pipeline.extract_actions import extract_actions
-from utils.io_helpers import timestamped_filename, ensure_dir
+from utils.io_helpers import timestamped_filename, ensure_dir, audio_duration, sha256_file
+
+import tempfile, os, io, shutil, traceback, json, queue, threading, numpy as np, pandas as pd
+
+def _first_two_sentences(s: str) -> str:
+    """Return the text up to the end of the second '. '-delimited sentence (bounded scan, no split)."""
+    i = s.find(". ")
+    j = s.find(". ", i + 2) if i != -1 else -1
+    return s if j == -1 else s[:j + 1]
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_transcribe(audio_sha256: str, model: str, _audio_path: str, _on_segment=None) -> dict:
+    """Transcription keyed on (upload digest, model); underscore args are not part of the cache key."""
+    return transcribe_audio(_audio_path, model=model, on_segment=_on_segment)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_summarize(transcript: str, max_chunk_words: int) -> str:
+    """Summary keyed on (transcript, chunk size); tone/prefix are applied outside so they stay instant."""
+    return summarize_transcript(transcript, max_chunk_words=max_chunk_words)
 
-from pydub import AudioSegment
-import tempfile, os, io, traceback, json, pandas as pd
 
 # ---- Page config ----
 st.set_page_config(page_title="Ava — AI Meeting Assistant", layout="wide")
 
+# A rerun abandons the previous script run; stop any transcription it left running
+_stale_cancel = st.session_state.pop("transcribe_cancel", None)
+if _stale_cancel is not None:
+    _stale_cancel.set()
+
 # ---- Custom CSS (dark + hot pink theme) ----
 st.markdown(
     """
@@ -133,44 +156,98 @@ with generate_col1:
         if not uploaded_file:
             st.error("Please upload an audio file first.")
         else:
-            wav_path = None
+            audio_path = None
+            tmp_in = None
             try:
-                with st.spinner("Converting audio..."):
-                    tmp_in = tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1])
-                    tmp_in.write(uploaded_file.getvalue())
+                with st.spinner("Preparing audio..."):
+                    ext = os.path.splitext(uploaded_file.name)[1].lower()
+                    tmp_in = tempfile.NamedTemporaryFile(delete=False, suffix=ext)
+                    uploaded_file.seek(0)
+                    shutil.copyfileobj(uploaded_file, tmp_in, length=1 << 20)
                     tmp_in.flush()
                     tmp_in.close()
-                    audio = AudioSegment.from_file(tmp_in.name)
-                    tmp_out = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                    audio.export(tmp_out.name, format="wav")
-                    wav_path = tmp_out.name
+                    audio_sha256 = sha256_file(tmp_in.name)
+                    # whisper decodes mp3/m4a/wav itself (streamed, resampled to 16 kHz) - no convert step
+                    audio_path = tmp_in.name
+                    duration_sec = audio_duration(audio_path)
+                    if duration_sec is not None:
+                        st.success(f"Loaded: {uploaded_file.name} — {duration_sec:.1f}s")
+                    else:
+                        st.success(f"Loaded: {uploaded_file.name}")
+            except Exception as e:
+                st.error("Could not prepare uploaded audio: " + str(e))
+                audio_path = None
+                # don't leave the partially written upload behind
+                if tmp_in is not None:
                     try:
+                        tmp_in.close()
                         os.unlink(tmp_in.name)
                     except Exception:
                         pass
-                    duration_sec = len(audio) / 1000.0
-                    st.success(f"Loaded: {uploaded_file.name} — {duration_sec:.1f}s")
-            except Exception as e:
-                st.error("Audio conversion failed: " + str(e))
-                wav_path = None
 
-            if wav_path:
+            if audio_path:
+                worker = None
                 try:
                     # Transcription (with timestamps optionally)
                     with st.spinner("Transcribing..."):
-                        trans_res = transcribe_audio(wav_path, model=model_choice)
+                        # Run whisper off the script thread and show segments as they arrive
+                        seg_queue = queue.Queue()
+                        trans_box = {}
+                        cancel = threading.Event()
+                        st.session_state.transcribe_cancel = cancel
+
+                        def _on_segment(seg):
+                            if cancel.is_set():
+                                raise TranscriptionCancelled()
+                            seg_queue.put(seg)
+
+                        def _transcribe_worker():
+                            try:
+                                trans_box["result"] = _cached_transcribe(audio_sha256, model_choice, audio_path, _on_segment)
+                            except Exception as ex:
+                                trans_box["error"] = ex
+                            finally:
+                                # the worker owns the audio file: a rerun can abandon this thread mid-transcription
+                                try:
+                                    os.unlink(audio_path)
+                                except Exception:
+                                    pass
+
+                        worker = threading.Thread(target=_transcribe_worker, daemon=True)
+                        worker.start()
+                        live_transcript = st.empty()
+                        partial_lines = []
+                        while worker.is_alive() or not seg_queue.empty():
+                            try:
+                                seg = seg_queue.get(timeout=0.25)
+                            except queue.Empty:
+                                continue
+                            partial_lines.append(seg.get("text", "").strip())
+                            # drain everything already queued, then render once per poll
+                            while True:
+                                try:
+                                    seg = seg_queue.get_nowait()
+                                except queue.Empty:
+                                    break
+                                partial_lines.append(seg.get("text", "").strip())
+                            live_transcript.markdown(" ".join(partial_lines))
+                        worker.join()
+                        st.session_state.pop("transcribe_cancel", None)
+                        live_transcript.empty()
+                        if "error" in trans_box:
+                            raise trans_box["error"]
+                        trans_res = trans_box["result"]
                         raw_text = trans_res.get("text", "") or ""
                         segments = trans_res.get("segments", []) or []
 
                         if include_timestamps and segments:
-                            # build a timestamped transcript
-                            lines = []
-                            for seg in segments:
-                                start = int(seg.get("start", 0))
-                                m, s = divmod(start, 60)
-                                ts = f"[{m:02d}:{s:02d}]"
-                                lines.append(f"{ts} {seg.get('text','').strip()}")
-                            transcript_text = "\n".join(lines)
+                            # build a timestamped transcript (minutes/seconds computed for all segments at once)
+                            starts = np.fromiter((int(seg.get("start", 0)) for seg in segments), dtype=np.int32, count=len(segments))
+                            minutes, seconds = np.divmod(starts, 60)
+                            transcript_text = "\n".join(
+                                f"[{m:02d}:{s:02d}] {seg.get('text', '').strip()}"
+                                for m, s, seg in zip(minutes.tolist(), seconds.tolist(), segments)
+                            )
                         else:
                             transcript_text = raw_text
 
@@ -183,7 +260,7 @@ with generate_col1:
                         # We don't have a 'tone' parameter in the summarizer; we can slightly modify behavior by
                         # including the style as a simple prompt-like prefix in the transcript for the model pipeline,
                         # but summarizer here is a simple pipeline — so we'll post-process prefix for clarity.
-                        summary_text = summarize_transcript(st.session_state.transcript, max_chunk_words=max_chunk_words)
+                        summary_text = _cached_summarize(st.session_state.transcript, max_chunk_words)
                         # Apply tone adjustments (light heuristics)
                         if minutes_tone.startswith("Concise"):
                             # keep as-is (already concise)
@@ -194,8 +271,7 @@ with generate_col1:
                             final_summary = "**Action-focused minutes**\n\n" + summary_text
                         else:  # Executive
                             # take first 2 sentences as executive highlight (naive)
-                            sentences = summary_text.split(". ")
-                            final_summary = ". ".join(sentences[:2]).strip()
+                            final_summary = _first_two_sentences(summary_text).strip()
                             if not final_summary.endswith("."):
                                 final_summary += "."
                         if custom_prefix:
@@ -212,10 +288,11 @@ with generate_col1:
                     st.error("Processing failed: " + str(e))
                     st.text(traceback.format_exc())
                 finally:
-                    try:
-                        os.unlink(wav_path)
-                    except Exception:
-                        pass
+                    if worker is None:
+                        try:
+                            os.unlink(audio_path)
+                        except Exception:
+                            pass
 
 with generate_col2:
     st.write("")  # spacer
@@ -12,18 +12,41 @@ This module is defensive at import time (no heavy work runs on import).
 import json
 import re
 from typing import List, Dict, Any
-from transformers import pipeline
+from pipeline.models import load_quantized_seq2seq
+import numpy as np
+import torch
 import logging
 
 logger = logging.getLogger(__name__)
 
 FLAN_MODEL = "google/flan-t5-small"
+# Flan-T5 input window, and token overlap between consecutive transcript chunks
+FLAN_MAX_INPUT_TOKENS = 512
+FLAN_CHUNK_OVERLAP_TOKENS = 32
 
 # Keywords to look for in regex fallback
 ACTION_KEYWORDS = [
     "action", "todo", "to do", "will", "should", "please", "assign", "deadline", "by", "due", "follow up", "follow-up"
 ]
 
+# Precompiled patterns for the regex fallback
+_SENT_SPLIT = re.compile(r'(?<=[.!?]) +')
+_KEYWORD_RE = re.compile('|'.join(map(re.escape, ACTION_KEYWORDS)), re.IGNORECASE)
+# Sentences that begin with common imperative verbs or polite requests
+# (MULTILINE so it can also scan newline-joined sentences in one pass)
+_VERB_START = re.compile(
+    r'^(?:Please |please |(?:Add|Assign|Follow|Follow up|Follow-up|Call|Email|Schedule|Create|Prepare|Send|Complete|Finish|Investigate|Confirm|Book|Plan|Share|Provide|Discuss|Setup|Set up|Make|Organize|Arrange)\b)',
+    re.IGNORECASE | re.MULTILINE
+)
+_BY_RE = re.compile(r'\bby ([A-Z][\w\s\-\']+|\d{1,2}(?:st|nd|rd|th)? [A-Za-z]+|\d{4}|\w+)\b')
+_OWNER_RE = re.compile(r'([A-Z][a-z]+(?: [A-Z][a-z]+)*) will\b')
+_MONTH_RE = re.compile(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\d{4}')
+
+def _get_generator(model: str = FLAN_MODEL):
+    """Return the cached, int8-quantized text2text-generation pipeline (see pipeline/models.py)."""
+    return load_quantized_seq2seq("text2text-generation", model)
+
 def _build_prompt_for_flan(transcript: str) -> str:
     instruction = (
         "You are an assistant that reads meeting transcripts and extracts action items. "
@@ -34,6 +57,38 @@ def _build_prompt_for_flan(transcript: str) -> str:
     )
     return instruction + transcript.strip()
 
+def _build_chunked_prompts(transcript: str, tokenizer) -> List[str]:
+    """
+    Split the transcript by token count so each prompt fits the Flan-T5 input window.
+    Consecutive chunks overlap slightly so sentences on a boundary aren't lost.
+    """
+    overhead = len(tokenizer(_build_prompt_for_flan(""))["input_ids"])
+    window = max(FLAN_MAX_INPUT_TOKENS - overhead, FLAN_CHUNK_OVERLAP_TOKENS + 1)
+    ids = tokenizer(transcript, add_special_tokens=False)["input_ids"]
+    if len(ids) <= window:
+        return [_build_prompt_for_flan(transcript)]
+
+    prompts = []
+    step = window - FLAN_CHUNK_OVERLAP_TOKENS
+    for start in range(0, len(ids), step):
+        piece = tokenizer.decode(ids[start:start + window], skip_special_tokens=True)
+        prompts.append(_build_prompt_for_flan(piece))
+        if start + window >= len(ids):
+            break
+    return prompts
+
+def _dedupe_key(item: Any) -> tuple:
+    """
+    Content key for merging items across overlapping chunks.
+    Ignores the model's per-chunk id, which restarts at 1 in every chunk.
+    """
+    if not isinstance(item, dict):
+        return (" ".join(str(item).lower().split()), "", "")
+    action = item.get("action") or item.get("action_text") or item.get("task") or ""
+    owner = item.get("owner") or ""
+    deadline = item.get("deadline") or ""
+    return tuple(" ".join(str(v).lower().split()) for v in (action, owner, deadline))
+
 def _parse_model_output_to_json(text: str) -> List[Dict[str, Any]]:
     """
     Try to safely extract a JSON array from model text output.
@@ -69,50 +124,51 @@ def _regex_fallback(transcript: str) -> List[Dict[str, Any]]:
     # Normalize
     s = transcript.replace("\n", " ")
     # Split into sentences (naive)
-    sentences = re.split(r'(?<=[.!?]) +', s)
+    sentences = [t for t in (sent.strip() for sent in _SENT_SPLIT.split(s)) if t]
     actions = []
     id_counter = 1
+    if not sentences:
+        return actions
 
-    # Pattern for sentences that begin with common imperative verbs or polite requests
-    verb_start_pattern = re.compile(
-        r'^(?:Please |please |(?:Add|Assign|Follow|Follow up|Follow-up|Call|Email|Schedule|Create|Prepare|Send|Complete|Finish|Investigate|Confirm|Book|Plan|Share|Provide|Discuss|Setup|Set up|Make|Organize|Arrange)\b)',
-        re.IGNORECASE
-    )
+    # Scan all sentences at once: keyword hits anywhere, imperative verbs at a line start.
+    # Sentences contain no newlines (normalized above), so "\n" is a safe separator.
+    joined = "\n".join(sentences)
+    starts = np.cumsum([0] + [len(t) + 1 for t in sentences[:-1]])
+    positions = [m.start() for m in _KEYWORD_RE.finditer(joined)]
+    positions.extend(m.start() for m in _VERB_START.finditer(joined))
+    if not positions:
+        return actions
+    hits = np.unique(np.searchsorted(starts, np.array(positions), side="right") - 1)
 
-    for sent in sentences:
-        text = sent.strip()
-        if not text:
-            continue
-        lowered = text.lower()
-        # if contains keywords or looks imperative
-        if any(k in lowered for k in ACTION_KEYWORDS) or verb_start_pattern.search(text):
-            # Attempt to detect owner (simple heuristics)
-            owner = None
-            deadline = None
+    for idx in hits:
+        text = sentences[idx]
+        # Attempt to detect owner (simple heuristics)
+        owner = None
+        deadline = None
+
+        # by <name/date>
+        m_by = _BY_RE.search(text)
+        if m_by:
+            candidate = m_by.group(1).strip()
+            # detect if candidate looks like a date (month name or year)
+            if _MONTH_RE.search(candidate) or _YEAR_RE.search(candidate):
+                deadline = candidate
+            else:
+                owner = candidate
 
-            # by <name/date>
-            m_by = re.search(r'\bby ([A-Z][\w\s\-\']+|\d{1,2}(?:st|nd|rd|th)? [A-Za-z]+|\d{4}|\w+)\b', text)
-            if m_by:
-                candidate = m_by.group(1).strip()
-                # detect if candidate looks like a date (month name or year)
-                if re.search(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)', candidate, re.IGNORECASE) or re.search(r'\d{4}', candidate):
-                    deadline = candidate
-                else:
-                    owner = candidate
-
-            # "<Name> will ..." pattern
-            m_owner = re.search(r'([A-Z][a-z]+(?: [A-Z][a-z]+)*) will\b', text)
-            if m_owner:
-                owner = m_owner.group(1)
-
-            actions.append({
-                "id": id_counter,
-                "action": text if len(text) < 1000 else text[:1000],
-                "owner": owner if owner else None,
-                "deadline": deadline if deadline else None,
-                "context": text
-            })
-            id_counter += 1
+        # "<Name> will ..." pattern
+        m_owner = _OWNER_RE.search(text)
+        if m_owner:
+            owner = m_owner.group(1)
+
+        actions.append({
+            "id": id_counter,
+            "action": text if len(text) < 1000 else text[:1000],
+            "owner": owner if owner else None,
+            "deadline": deadline if deadline else None,
+            "context": text
+        })
+        id_counter += 1
 
     return actions
 
@@ -136,16 +192,26 @@ def extract_actions(transcript: str, use_model: bool = True) -> List[Dict[str, A
     if not use_model:
         return _regex_fallback(transcript)
 
-    prompt = _build_prompt_for_flan(transcript)
     try:
-        # device=-1 ensures CPU
-        generator = pipeline("text2text-generation", model=FLAN_MODEL, device=-1)
-        resp = generator(prompt, max_length=512, do_sample=False)
-        raw = resp[0].get("generated_text", "") if isinstance(resp, list) else str(resp)
-        items = _parse_model_output_to_json(raw)
-        if not items:
-            # Try another heuristic: sometimes the model returns plain text with JSON embedded
-            items = _parse_model_output_to_json(raw)
+        generator = _get_generator(FLAN_MODEL)
+        prompts = _build_chunked_prompts(transcript, generator.tokenizer)
+        with torch.inference_mode():
+            resp = generator(prompts, batch_size=2, max_length=256, do_sample=False)
+        raws = []
+        for r in resp:
+            if isinstance(r, list):
+                r = r[0] if r else {}
+            raws.append(r.get("generated_text", "") if isinstance(r, dict) else str(r))
+
+        # Union of items across chunks; overlapping windows may repeat an item
+        items = []
+        seen = set()
+        for chunk_raw in raws:
+            for it in _parse_model_output_to_json(chunk_raw):
+                key = _dedupe_key(it)
+                if key not in seen:
+                    seen.add(key)
+                    items.append(it)
         if not items:
             # fallback to regex heuristics
             items = _regex_fallback(transcript)
@@ -153,7 +219,7 @@ def extract_actions(transcript: str, use_model: bool = True) -> List[Dict[str, A
         logger.exception("Flan-T5 extraction failed, using regex fallback: %s", e)
         items = _regex_fallback(transcript)
 
-    # Normalize to required keys and ensure sequential ids
+    # Normalize to required keys and renumber ids sequentially across chunks
     normalized = []
     for idx, it in enumerate(items, start=1):
         if isinstance(it, dict):
@@ -10,22 +10,29 @@ chunking the transcript to avoid length limits.
 from typing import List
 import math
 import re
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
+from pipeline.models import load_quantized_seq2seq
 import os
 import torch
 
 # Ensure CPU-only pipelines by setting device=-1 when creating pipeline
 SUMMARIZER_MODEL = "sshleifer/distilbart-cnn-12-6"
 
-# Simple word-based chunker
+def _get_summarizer(model: str = SUMMARIZER_MODEL):
+    """Return the cached, int8-quantized summarization pipeline (see pipeline/models.py)."""
+    return load_quantized_seq2seq("summarization", model, truncation=True)
+
+_WORD_RE = re.compile(r'\S+')
+
+# Simple word-based chunker: slices the original text at word boundaries
+# (no re-joining of tokens, original whitespace inside a chunk is preserved)
 def _chunk_text(text: str, max_words: int = 800) -> List[str]:
-    words = text.split()
-    if len(words) <= max_words:
+    spans = [m.span() for m in _WORD_RE.finditer(text)]
+    if len(spans) <= max_words:
         return [text]
     chunks = []
-    for i in range(0, len(words), max_words):
-        chunk = " ".join(words[i:i + max_words])
-        chunks.append(chunk)
+    for i in range(0, len(spans), max_words):
+        last = min(i + max_words, len(spans)) - 1
+        chunks.append(text[spans[i][0]:spans[last][1]])
     return chunks
 
 def _clean_summary(s: str) -> str:
@@ -38,34 +45,47 @@ def summarize_transcript(transcript: str, max_chunk_words: int = 800) -> str:
     """
     Summarize transcript into 'meeting minutes' style text.
     - Chunk transcript into manageable pieces
-    - Summarize each chunk, then combine and summarize the combination
+    - Summarize each chunk, then combine and summarize the combination (skipped for a single chunk)
     """
     if not transcript or not transcript.strip():
         return ""
 
     chunks = _chunk_text(transcript, max_chunk_words)
 
-    # Load summarization pipeline (CPU)
-    # device=-1 ensures CPU
-    summarizer = pipeline("summarization", model=SUMMARIZER_MODEL, device=-1, truncation=True)
+    # Load summarization pipeline (CPU, cached across calls)
+    summarizer = _get_summarizer(SUMMARIZER_MODEL)
+
+    # small models sometimes require short max_length; we keep conservative values
+    gen_kwargs = dict(max_length=130, min_length=30, truncation=True, do_sample=False)
+    try:
+        # One batched call over all chunks amortizes tokenizer/Python overhead
+        with torch.inference_mode():
+            outs = summarizer(chunks, batch_size=min(4, len(chunks)), **gen_kwargs)
+        partial_summaries = [o["summary_text"].strip() for o in outs]
+    except Exception:
+        # Batch failed: retry chunk by chunk so one bad chunk doesn't sink the rest
+        partial_summaries = []
+        for chunk in chunks:
+            try:
+                with torch.inference_mode():
+                    out = summarizer(chunk, **gen_kwargs)
+                text = out[0]["summary_text"]
+            except Exception:
+                # fallback naive: take first & last sentences
+                sentences = re.split(r'(?<=[.!?]) +', chunk)
+                text = " ".join(sentences[:3])  # naive fallback
+            partial_summaries.append(text.strip())
 
-    partial_summaries = []
-    for i, chunk in enumerate(chunks):
-        # small models sometimes require short max_length; we keep conservative values
-        try:
-            out = summarizer(chunk, max_length=130, min_length=30, do_sample=False)
-            text = out[0]["summary_text"]
-        except Exception:
-            # fallback naive: take first & last sentences
-            sentences = re.split(r'(?<=[.!?]) +', chunk)
-            text = " ".join(sentences[:3])  # naive fallback
-        partial_summaries.append(text.strip())
+    # A single chunk's summary is already final - re-summarizing it only costs time and detail
+    if len(chunks) == 1:
+        return _clean_summary(partial_summaries[0])
 
     # Combine partial summaries and condense to a final minutes summary
     combined = "\n\n".join(partial_summaries)
     # A final pass summarization to unify tone
     try:
-        final = summarizer(combined, max_length=180, min_length=60, do_sample=False)
+        with torch.inference_mode():
+            final = summarizer(combined, max_length=180, min_length=60, do_sample=False)
         final_text = final[0]["summary_text"]
     except Exception:
         final_text = combined
@@ -1,83 +1,152 @@
 """
 pipeline/transcribe.py
 
-Provides transcribe_audio(path, model="tiny.en") -> {"text": ..., "segments": [...]}
+Provides transcribe_audio(path, model="tiny.en", on_segment=None) -> {"text": ..., "segments": [...]}
 
-Uses openai-whisper by default (CPU). If faster-whisper or whisper.cpp are
-available, you'll see messages guiding how to switch - but the default path
-uses the pure Python whisper package so it runs on CPU without compilation.
+Uses faster-whisper (CTranslate2, int8 on CPU) when it is installed, since it
+is considerably faster and lighter than the pure Python package. Falls back to
+openai-whisper (CPU) otherwise, so the app still runs without compilation.
 """
 
 import os
 import json
+import logging
 import subprocess
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Optional
 
-# Prefer the openai-whisper package (pure Python)
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# force CPU - whisper uses torch; if CUDA available it may use it by default,
+# but we can't rely on GPU. Hide CUDA devices before any model is loaded.
+os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+# openai-whisper package (pure Python) - fallback backend
 try:
     import whisper
     WHISPER_AVAILABLE = True
 except Exception:
     WHISPER_AVAILABLE = False
 
-# faster-whisper optional detection (not used by default)
+# faster-whisper optional detection (preferred when available)
 try:
     from faster_whisper import WhisperModel as FasterWhisperModel  # type: ignore
     FASTER_WHISPER_AVAILABLE = True
 except Exception:
     FASTER_WHISPER_AVAILABLE = False
 
-def _run_whisper_python(path: str, model_name: str = "tiny.en") -> Dict[str, Any]:
+
+class TranscriptionCancelled(Exception):
+    """Raised from an on_segment callback to stop a transcription that is no longer wanted."""
+
+
+@st.cache_resource(show_spinner=False)
+def _get_whisper_model(model_name: str):
+    """
+    Load an openai-whisper model once per process and reuse it across Streamlit reruns.
+    whisper.load_model will download model to ~/.cache/whisper by default.
+    """
+    return whisper.load_model(model_name)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_faster_whisper_model(model_name: str):
+    """
+    Load a faster-whisper (CTranslate2) model once per process with int8 weights on CPU.
+    """
+    return FasterWhisperModel(model_name, device="cpu", compute_type="int8")
+
+
+def _run_whisper_python(path: str, model_name: str = "tiny.en",
+                        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
     """
     Use openai-whisper package (python) to transcribe. Returns dict with text and segments.
     Ensures CPU usage by not moving torch to GPU.
+    openai-whisper has no incremental API, so on_segment is called for each segment once decoding finishes.
     """
     if not WHISPER_AVAILABLE:
         raise RuntimeError("openai-whisper package not installed (pip install openai-whisper).")
 
-    # whisper.load_model will download model to ~/.cache/whisper by default.
-    model = whisper.load_model(model_name)
-    # force CPU - whisper uses torch; if CUDA available it may use it by default,
-    # but we can't rely on GPU. We proactively set torch device environment variables:
-    os.environ["CUDA_VISIBLE_DEVICES"] = ""  # hides CUDA devices if any
+    model = _get_whisper_model(model_name)
     # transcribe
     result = model.transcribe(path, language="en", verbose=False)
     # result contains 'text' and 'segments' keys
-    return {"text": result.get("text", ""), "segments": result.get("segments", [])}
+    segs = result.get("segments", [])
+    if on_segment:
+        for seg in segs:
+            on_segment(seg)
+    return {"text": result.get("text", ""), "segments": segs}
 
 
-def _run_faster_whisper(path: str, model_name: str = "tiny.en") -> Dict[str, Any]:
+def _run_faster_whisper(path: str, model_name: str = "tiny.en",
+                        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
     """
-    Optional: if faster-whisper is installed you can use it (faster on CPU for some setups).
-    We detect but do not default to it, to keep behavior predictable.
+    Use faster-whisper (CTranslate2, int8 on CPU) to transcribe. Returns dict with text and segments.
+    Greedy decoding (beam_size=1) keeps decoder compute low on CPU.
+    Segments are decoded lazily, so on_segment is called as each one becomes available.
     """
     if not FASTER_WHISPER_AVAILABLE:
         raise RuntimeError("faster-whisper not installed.")
-    model = FasterWhisperModel(model_name, device="cpu", compute_type="int8")
-    segments, info = model.transcribe(path, beam_size=5)
-    text = " ".join([s.text for s in segments])
-    segs = [{"start": s.start, "end": s.end, "text": s.text} for s in segments]
+    model = _get_faster_whisper_model(model_name)
+    segments, info = model.transcribe(path, language="en", beam_size=1)
+    # segments is a generator - consume it once, reporting each segment as it is decoded
+    segs = []
+    for s in segments:
+        seg = {"start": s.start, "end": s.end, "text": s.text}
+        segs.append(seg)
+        if on_segment:
+            on_segment(seg)
+    text = "".join(s["text"] for s in segs).strip()
     return {"text": text, "segments": segs}
 
 
-def transcribe_audio(path: str, model: str = "tiny.en") -> Dict[str, Any]:
+def transcribe_audio(path: str, model: str = "tiny.en",
+                     on_segment: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
     """
     Main entrypoint for transcription.
     Returns: {"text": full_transcript, "segments": [ {"start":float,"end":float,"text":str}, ... ]}
-    Defaults to CPU Python whisper ("tiny.en" recommended for speed).
+    on_segment, if given, is called with each segment dict as it is produced (e.g. queue.Queue.put);
+    it may raise TranscriptionCancelled to abort, which is re-raised without falling back.
+    Uses faster-whisper when installed, otherwise CPU Python whisper ("tiny.en" recommended for speed).
+    A "faster-" prefix on the model name is accepted for backwards compatibility.
     """
     # Safety: ensure path exists
     if not os.path.exists(path):
         raise FileNotFoundError(f"Audio file not found: {path}")
 
-    # If faster-whisper installed and user passed "faster" as model, switch
-    if model.startswith("faster-") and FASTER_WHISPER_AVAILABLE:
-        actual_model = model.replace("faster-", "")
-        return _run_faster_whisper(path, actual_model)
+    actual_model = model.replace("faster-", "")
+
+    # Preferred: faster-whisper (int8 CTranslate2) when installed
+    if FASTER_WHISPER_AVAILABLE:
+        reported = []
+
+        def _report(seg: Dict[str, Any]) -> None:
+            reported.append(True)
+            on_segment(seg)
+
+        try:
+            return _run_faster_whisper(path, actual_model, _report if on_segment else None)
+        except TranscriptionCancelled:
+            raise
+        except Exception as e:
+            if not WHISPER_AVAILABLE:
+                raise RuntimeError(
+                    "Transcription failed using faster-whisper. "
+                    "Make sure ffmpeg is available. "
+                    f"Inner error: {e}"
+                )
+            logger.warning("faster-whisper failed, falling back to openai-whisper: %s", e)
+            if reported:
+                # the caller already received faster-whisper's partial segments; the
+                # fallback re-transcribes from the start, so don't report them twice
+                on_segment = None
 
-    # Default: openai-whisper python package
+    # Fallback: openai-whisper python package
     try:
-        return _run_whisper_python(path, model)
+        return _run_whisper_python(path, actual_model, on_segment)
+    except TranscriptionCancelled:
+        raise
     except Exception as e:
         # If whisper fails (missing dependency), try to detect whisper.cpp or give helpful error
         # whisper.cpp fallback: if `whisper.cpp` binary present and model available, we could call it.
@@ -1,12 +1,16 @@
 """
 utils/io_helpers.py
 
-Small helpers for saving outputs and safe JSON parsing.
+Small helpers for saving outputs, safe JSON parsing and audio file inspection.
 """
 
+import hashlib
 import json
+import shutil
+import subprocess
+import wave
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 import os
 
 def timestamped_filename(prefix: str, ext: str) -> str:
@@ -31,3 +35,32 @@ def try_parse_json(text: str):
 
 def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
+
+def sha256_file(path: str, block_size: int = 1 << 20) -> str:
+    """Return the hex SHA-256 of a file, read in blocks so large uploads aren't loaded into memory."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def audio_duration(path: str) -> Optional[float]:
+    """
+    Return the duration in seconds of an audio file, or None if it can't be determined.
+    WAV files are read from their header; other formats are probed with ffprobe.
+    """
+    try:
+        with wave.open(path, "rb") as w:
+            return w.getnframes() / float(w.getframerate())
+    except Exception:
+        pass
+    if not shutil.which("ffprobe"):
+        return None
+    try:
+        out = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+            check=True, capture_output=True, text=True,
+        )
+        return float(out.stdout.strip())
+    except Exception:
+        return None